@@ -63,16 +63,14 @@ def save_checkpoint(folder, generator, discriminator, optimizer_g, optimizer_d,
 
 
 def load_checkpoint(folder, generator, discriminator, optimizer_g, optimizer_d, device, current_config):
-    # Find all checkpoint files in the folder
-    ckpt_files = [f for f in os.listdir(folder) if f.startswith(
-        "ckpt_epoch_") and f.endswith(".pth")]
-    if not ckpt_files:
+    # Find all checkpoint files (ckpt_epoch_{epoch}_{date}_{time}.pth) in a single directory scan
+    ckpt_entries = [(int(e.name.split("_")[2]), e.stat().st_mtime, e.path) for e in os.scandir(folder)
+                    if e.name.startswith("ckpt_epoch_") and e.name.endswith(".pth")]
+    if not ckpt_entries:
         logger.info("No checkpoint files found; starting fresh.")
         return 0, 0, None
-    # Determine the latest checkpoint (highest epoch number)
-    latest_ckpt = max(ckpt_files, key=lambda f: int(
-        f.split("_")[-1].split(".")[0]))
-    checkpoint_path = os.path.join(folder, latest_ckpt)
+    # Determine the latest checkpoint (highest epoch number, newest file on ties)
+    checkpoint_path = max(ckpt_entries)[2]
     state = torch.load(checkpoint_path, map_location=device)
 
     checkpoint_config = state.get("config", {})
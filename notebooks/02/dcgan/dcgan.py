@@ -3,18 +3,27 @@ import datetime
 import hashlib
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pprint
 
 import torch
+import torch.distributed as dist
 import torch.nn as nn
 import torch.nn.functional as F
 import torchvision
 import wandb
 import yaml
-from torch.utils.data import DataLoader
+from torch.nn.parallel import DistributedDataParallel as DDP
+from torch.utils.data import DataLoader, DistributedSampler, TensorDataset
 from torchvision import datasets, transforms
 from tqdm import tqdm
 
+try:
+    from nvidia.dali import fn, pipeline_def, types
+    from nvidia.dali.plugin.pytorch import DALIGenericIterator, LastBatchPolicy
+except ImportError:
+    pipeline_def = None
+
 # ------------------------------
 # Logging Configuration
 # ------------------------------
@@ -89,8 +98,8 @@ class Discriminator(nn.Module):
             nn.BatchNorm2d(self.ndf * 8),
             nn.LeakyReLU(0.2, inplace=True),
             # State: (ndf*8) x 4 x 4
-            nn.Conv2d(self.ndf * 8, 1, 4, 1, 0, bias=False),
-            nn.Sigmoid()
+            nn.Conv2d(self.ndf * 8, 1, 4, 1, 0, bias=False)
+            # Output: raw logits, paired with binary_cross_entropy_with_logits
         )
     
     def forward(self, input):
@@ -104,12 +113,17 @@ def generate_checkpoint_folder(config):
     # Create a string from key hyperparameters
     key_params = f"{config['lr']}_{config['batch_size']}_{config['latent_dim']}_{config['ngf']}_{config['ndf']}"
 
-    config_hash = hashlib.sha256(key_params.encode()).hexdigest()[:8]
+    # Non-cryptographic ID: a 4-byte BLAKE2s digest gives the same 8 hex characters directly
+    config_hash = hashlib.blake2s(key_params.encode(), digest_size=4).hexdigest()
     base_path = config.get("checkpoint_dir", "checkpoints")
     os.makedirs(base_path, exist_ok=True)
     folder_name = f"dcgan_lr{config['lr']}_bs{config['batch_size']}_latent{config['latent_dim']}_ngf{config['ngf']}_ndf{config['ndf']}_{config_hash}"
     folder_path = os.path.join(base_path, folder_name)
     os.makedirs(folder_path, exist_ok=True)
+
+    # Under DDP only rank 0 writes the log file and the config
+    if dist.is_initialized() and dist.get_rank() != 0:
+        return folder_path
     
     # Set up a file handler for logging metadata in this folder
     log_file = os.path.join(folder_path, "experiment.log")
@@ -119,51 +133,100 @@ def generate_checkpoint_folder(config):
     logger.addHandler(file_handler)
     
     logger.info(f"Checkpoint folder created at: {folder_path}")
+
+    # The config is fixed for the run, so it is written once here rather than with every checkpoint
+    config_path = os.path.join(folder_path, "config.yaml")
+    with open(config_path, "w") as f:
+        yaml.dump(config, f)
+    logger.info(f"Configuration saved at {config_path}")
     return folder_path
 
 
 # ------------------------------
 # Checkpoint Saving & Loading
 # ------------------------------
-def save_checkpoint(folder, generator, discriminator, optimizer_g, optimizer_d, epoch, global_step, config):
+# Serialization and uploads run on a single background thread so they overlap with training
+_checkpoint_executor = ThreadPoolExecutor(max_workers=1)
+_pending_checkpoint = None
+# Pinned CPU copies of the last snapshot, reused as the destination of the next one
+_checkpoint_shadow = {}
+
+
+def _to_cpu(obj, shadow=None):
+    # Copy every tensor to CPU so the snapshot is unaffected by subsequent optimizer steps.
+    # Buffers from the previous snapshot are reused when shapes match; new ones are pinned
+    # so the device-to-host copies can be issued asynchronously.
+    if isinstance(obj, torch.Tensor):
+        if not (isinstance(shadow, torch.Tensor) and shadow.shape == obj.shape and shadow.dtype == obj.dtype):
+            shadow = torch.empty_like(obj, device="cpu", pin_memory=obj.is_cuda)
+        return shadow.copy_(obj.detach(), non_blocking=True)
+    if isinstance(obj, dict):
+        shadow = shadow if isinstance(shadow, dict) else {}
+        return {k: _to_cpu(v, shadow.get(k)) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        shadow = shadow if isinstance(shadow, (list, tuple)) and len(shadow) == len(obj) else [None] * len(obj)
+        return type(obj)(_to_cpu(v, s) for v, s in zip(obj, shadow))
+    return obj
+
+
+def wait_for_checkpoint():
+    # Block until the in-flight checkpoint (if any) is written; re-raises its exception
+    global _pending_checkpoint
+    if _pending_checkpoint is not None:
+        _pending_checkpoint.result()
+        _pending_checkpoint = None
+
+
+def save_checkpoint(folder, generator, discriminator, optimizer_g, optimizer_d, scaler, epoch, global_step, config):
+    global _pending_checkpoint
+    wait_for_checkpoint()
+
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     checkpoint_filename = f"ckpt_epoch_{epoch}_{timestamp}.pth"
     checkpoint_path = os.path.join(folder, checkpoint_filename)
+    # The previous write has finished, so its buffers can be overwritten
+    for key, state_dict in [("generator_state_dict", generator.state_dict()),
+                            ("discriminator_state_dict", discriminator.state_dict()),
+                            ("optimizer_g_state_dict", optimizer_g.state_dict()),
+                            ("optimizer_d_state_dict", optimizer_d.state_dict())]:
+        _checkpoint_shadow[key] = _to_cpu(state_dict, _checkpoint_shadow.get(key))
+    # Wait once for all queued device-to-host copies instead of syncing per tensor
+    if next(generator.parameters()).is_cuda:
+        torch.cuda.current_stream().synchronize()
+
     state = {
         "epoch": epoch,
         "global_step": global_step,
-        "generator_state_dict": generator.state_dict(),
-        "discriminator_state_dict": discriminator.state_dict(),
-        "optimizer_g_state_dict": optimizer_g.state_dict(),
-        "optimizer_d_state_dict": optimizer_d.state_dict(),
+        **_checkpoint_shadow,
+        "scaler_state_dict": scaler.state_dict(),
         "wandb_run_id": wandb.run.id if wandb.run else None,
         "config": config
     }
+    _pending_checkpoint = _checkpoint_executor.submit(_write_checkpoint, checkpoint_path, state, epoch, timestamp)
+
+
+def _write_checkpoint(checkpoint_path, state, epoch, timestamp):
     torch.save(state, checkpoint_path)
     logger.info(f"Checkpoint saved at epoch {epoch} to {checkpoint_path}")
     
-    config_path = os.path.join(folder, "config.yaml")
-    with open(config_path, "w") as f:
-        yaml.dump(config, f)
-    logger.info(f"Configuration saved at {config_path}")
-    
     # Log checkpoint as a WandB artifact with unique naming.
     artifact = wandb.Artifact(f"model-checkpoint-epoch-{epoch}-{timestamp}", type="model", description=f"Checkpoint at epoch {epoch}")
     artifact.add_file(checkpoint_path)
     wandb.log_artifact(artifact)
 
 
-def load_checkpoint(folder, generator, discriminator, optimizer_g, optimizer_d, device, current_config):
-    # Find all checkpoint files in the folder
-    ckpt_files = [f for f in os.listdir(folder) if f.startswith("ckpt_epoch_") and f.endswith(".pth")]
-    if not ckpt_files:
+def load_checkpoint(folder, generator, discriminator, optimizer_g, optimizer_d, scaler, device, current_config):
+    # Find all checkpoint files (ckpt_epoch_{epoch}_{date}_{time}.pth) in a single directory scan
+    ckpt_entries = [(int(e.name.split("_")[2]), e.stat().st_mtime, e.path) for e in os.scandir(folder)
+                    if e.name.startswith("ckpt_epoch_") and e.name.endswith(".pth")]
+    if not ckpt_entries:
         logger.info("No checkpoint files found; starting fresh.")
         return 0, 0, None
-    # Determine the latest checkpoint (highest epoch number)
-    latest_ckpt = max(ckpt_files, key=lambda f: int(f.split("_")[-1].split(".")[0]))
-    checkpoint_path = os.path.join(folder, latest_ckpt)
+    # Determine the latest checkpoint (highest epoch number, newest file on ties)
+    checkpoint_path = max(ckpt_entries)[2]
     state = torch.load(checkpoint_path, map_location=device)
-    pprint(state.keys())
+    if not dist.is_initialized() or dist.get_rank() == 0:
+        pprint(state.keys())
     
     checkpoint_config = state.get("config", {})
 
@@ -179,6 +242,9 @@ def load_checkpoint(folder, generator, discriminator, optimizer_g, optimizer_d,
     discriminator.load_state_dict(state["discriminator_state_dict"])
     optimizer_g.load_state_dict(state["optimizer_g_state_dict"])
     optimizer_d.load_state_dict(state["optimizer_d_state_dict"])
+    # Empty when the scaler is disabled (bf16/fp32) and absent in older checkpoints
+    if state.get("scaler_state_dict"):
+        scaler.load_state_dict(state["scaler_state_dict"])
 
     start_epoch = state["epoch"] + 1
     global_step = state.get("global_step", 0)
@@ -192,53 +258,89 @@ def load_checkpoint(folder, generator, discriminator, optimizer_g, optimizer_d,
 # ------------------------------
 # Training Epoch Function
 # ------------------------------
-def train_epoch(generator, discriminator, optimizer_g, optimizer_d, dataloader, device, config, epoch, global_step):
+def train_epoch(generator, discriminator, optimizer_g, optimizer_d, scaler, dataloader, device, config, epoch, global_step):
     generator.train()
     discriminator.train()
+
+    # Mixed precision: bf16 needs no loss scaling, fp16 goes through the GradScaler
+    amp_dtype = getattr(torch, config.get("amp_dtype", "bfloat16"))
+    use_amp = device.type == "cuda" and amp_dtype != torch.float32
     
-    total_g_loss = 0.0
-    total_d_loss = 0.0
+    # Accumulate on the device; .item() forces a host sync, so only call it when logging
+    total_g_loss = torch.zeros((), device=device)
+    total_d_loss = torch.zeros((), device=device)
     n_batches = 0
+
+    # Precompute adversarial ground truths; sliced to the size of each batch below
+    valid_full = torch.ones(config["batch_size"], device=device)
+    fake_full = torch.zeros_like(valid_full)
+
+    # Noise is refilled in place from a dedicated RNG, seeded per epoch so runs (and resumes) replay exactly
+    noise_buf = torch.empty(config["batch_size"], config["latent_dim"], 1, 1, device=device, memory_format=torch.channels_last)
+    # Offset by rank so data-parallel replicas do not generate identical fake batches
+    rank, world_size = (dist.get_rank(), dist.get_world_size()) if dist.is_initialized() else (0, 1)
+    noise_rng = torch.Generator(device=device).manual_seed(config.get("seed", 0) + epoch * world_size + rank)
     
+    # The progress bar still shows losses when WandB batch logging is disabled (log_interval == -1)
+    log_interval = config.get("log_interval", -1)
+    postfix_interval = log_interval if log_interval != -1 else 100
+
     progress_bar = tqdm(dataloader, desc=f"Epoch {epoch}/{config['epochs']}", unit="batch", leave=False)
     for i, (imgs, _) in enumerate(progress_bar):
-        imgs = imgs.to(device)
+        imgs = imgs.to(device, non_blocking=True, memory_format=torch.channels_last)
+        if imgs.dtype == torch.uint8:
+            # Cached images are stored as uint8; normalize to [-1, 1] on the GPU
+            imgs = imgs.float() / 127.5 - 1
         batch_size = imgs.size(0)
         n_batches += 1
 
         # Ground truths
-        valid = torch.ones(batch_size, device=device)
-        fake = torch.zeros(batch_size, device=device)
-
-        # -----------------
-        #  Train Generator
-        # -----------------
-        optimizer_g.zero_grad()
-        noise = torch.randn(batch_size, config["latent_dim"], 1, 1, device=device)
-        gen_imgs = generator(noise)
-        g_loss = F.binary_cross_entropy(discriminator(gen_imgs), valid)
-        g_loss.backward()
-        optimizer_g.step()
-
-        # ---------------------
-        #  Train Discriminator
-        # ---------------------
-        optimizer_d.zero_grad()
-        real_loss = F.binary_cross_entropy(discriminator(imgs), valid)
-        fake_loss = F.binary_cross_entropy(discriminator(gen_imgs.detach()), fake)
-        d_loss = (real_loss + fake_loss) / 2
-        d_loss.backward()
-        optimizer_d.step()
-
-        total_g_loss += g_loss.item()
-        total_d_loss += d_loss.item()
-
-        progress_bar.set_postfix(g_loss=g_loss.item(), d_loss=d_loss.item())
-
-        if config.get("log_interval", -1) != -1 and i % config["log_interval"] == 0:
+        valid = valid_full[:batch_size]
+        fake = fake_full[:batch_size]
+
+        # ---------------------------------------
+        #  Generator and Discriminator losses
+        # ---------------------------------------
+        optimizer_g.zero_grad(set_to_none=True)
+        optimizer_d.zero_grad(set_to_none=True)
+        noise = noise_buf[:batch_size].normal_(generator=noise_rng)
+        with torch.autocast(device_type=device.type, dtype=amp_dtype, enabled=use_amp):
+            gen_imgs = generator(noise)
+            # A single discriminator pass over the fake batch serves both losses
+            fake_logits = discriminator(gen_imgs)
+            g_loss = F.binary_cross_entropy_with_logits(fake_logits, valid)
+            real_loss = F.binary_cross_entropy_with_logits(discriminator(imgs), valid)
+            fake_loss = F.binary_cross_entropy_with_logits(fake_logits, fake)
+            d_loss = (real_loss + fake_loss) / 2
+
+        # ---------------------------------------
+        #  Update Generator and Discriminator
+        # ---------------------------------------
+        # Each backward only accumulates into its own network's parameters. Both updates
+        # see the pre-step weights, as in the previous G-then-D schedule (whose D step
+        # used the fake batch generated before the G update).
+        scaler.scale(g_loss).backward(inputs=list(generator.parameters()), retain_graph=True)
+        scaler.scale(d_loss).backward(inputs=list(discriminator.parameters()))
+        scaler.step(optimizer_g)
+        scaler.step(optimizer_d)
+        scaler.update()
+
+        # The discriminator-only backward does not free the generator's saved activations
+        # retained by the first backward; drop every graph reference before the next step
+        g_loss, d_loss = g_loss.detach(), d_loss.detach()
+        del gen_imgs, fake_logits, real_loss, fake_loss
+
+        total_g_loss += g_loss
+        total_d_loss += d_loss
+
+        if i % postfix_interval == 0:
+            batch_g_loss, batch_d_loss = g_loss.item(), d_loss.item()
+            progress_bar.set_postfix(g_loss=batch_g_loss, d_loss=batch_d_loss)
+
+        if log_interval != -1 and i % log_interval == 0:
             wandb.log({
-                "batch_g_loss": g_loss.item(),
-                "batch_d_loss": d_loss.item(),
+                "batch_g_loss": batch_g_loss,
+                "batch_d_loss": batch_d_loss,
                 "epoch": epoch,
                 "batch": i
             }, step=global_step)
@@ -246,8 +348,8 @@ def train_epoch(generator, discriminator, optimizer_g, optimizer_d, dataloader,
         global_step += 1
 
     # Compute average losses for the epoch
-    avg_g_loss = total_g_loss / n_batches
-    avg_d_loss = total_d_loss / n_batches
+    avg_g_loss = total_g_loss.item() / n_batches
+    avg_d_loss = total_d_loss.item() / n_batches
     wandb.log({
         "epoch_avg_g_loss": avg_g_loss,
         "epoch_avg_d_loss": avg_d_loss,
@@ -274,7 +376,46 @@ def evaluate(generator, device, config, step):
 # ------------------------------
 # DataLoader Initialization for CelebA
 # ------------------------------
-def get_dataloader(config):
+def _subset_rng(config):
+    # The subset must be identical on every process so a DistributedSampler can shard it
+    return torch.Generator().manual_seed(config.get("seed", 0))
+
+
+def _check_num_samples(num_samples, config):
+    # The partial last batch is dropped, so each rank needs at least one full batch per epoch
+    world_size = dist.get_world_size() if dist.is_initialized() else 1
+    if num_samples // world_size < config["batch_size"]:
+        raise ValueError(f"subset_size ({num_samples}) split across {world_size} process(es) is smaller than "
+                         f"batch_size ({config['batch_size']}); no full batch can be formed.")
+
+
+def _prepare_cache(config, cache_path):
+    # Run the deterministic crop/resize once and keep the result as uint8 (3 x 64 x 64 = 12KB per image)
+    transform = transforms.Compose([
+        transforms.CenterCrop(178),
+        transforms.Resize(config["image_size"]),
+        transforms.PILToTensor()
+    ])
+    dataset = datasets.CelebA(root=config["data_root"], split="train", transform=transform, download=True)
+    subset_size = config.get("subset_size", len(dataset))
+    indices = torch.randperm(len(dataset), generator=_subset_rng(config))[:subset_size]
+    loader = DataLoader(torch.utils.data.Subset(dataset, indices), batch_size=config["batch_size"],
+                        num_workers=config.get("num_workers", min(8, os.cpu_count() or 1)))
+
+    images = torch.empty(len(indices), config["nc"], config["image_size"], config["image_size"], dtype=torch.uint8)
+    offset = 0
+    for batch, _ in tqdm(loader, desc="Caching CelebA", unit="batch"):
+        images[offset:offset + batch.size(0)] = batch
+        offset += batch.size(0)
+
+    # Write to a temporary file first so an interrupted run never leaves a truncated cache behind
+    torch.save(images, cache_path + ".tmp")
+    os.replace(cache_path + ".tmp", cache_path)
+    logger.info(f"Cached {len(images)} preprocessed images to {cache_path}")
+    return images
+
+
+def _get_celeba_subset(config):
     transform = transforms.Compose([
         transforms.CenterCrop(178),            # Crop the faces to square
         transforms.Resize(config["image_size"]), # Resize to the desired image size (e.g., 64x64)
@@ -285,10 +426,84 @@ def get_dataloader(config):
     
     # Use a subset of the dataset
     subset_size = config.get("subset_size", len(dataset))
-    indices = torch.randperm(len(dataset))[:subset_size]
-    subset = torch.utils.data.Subset(dataset, indices)
-    
-    return DataLoader(subset, batch_size=config["batch_size"], shuffle=True, num_workers=0)
+    indices = torch.randperm(len(dataset), generator=_subset_rng(config))[:subset_size]
+    return torch.utils.data.Subset(dataset, indices)
+
+
+def get_dataloader(config):
+    if config.get("cache_dataset", False):
+        # The seed selects which images form the subset, so it is part of the cache key
+        cache_name = f"celeba_{config['image_size']}_{config.get('subset_size', 'all')}_seed{config.get('seed', 0)}.pt"
+        cache_path = os.path.join(config["data_root"], cache_name)
+        if os.path.exists(cache_path):
+            images = torch.load(cache_path, mmap=True)
+            logger.info(f"Loaded {len(images)} cached images from {cache_path}")
+        else:
+            images = _prepare_cache(config, cache_path)
+        subset = TensorDataset(images, torch.zeros(len(images), dtype=torch.long))
+    else:
+        subset = _get_celeba_subset(config)
+
+    # Decode/transform in worker processes so the GPU is not starved; workers are kept
+    # alive across epochs. Pinned host memory allows non_blocking host-to-device copies.
+    # Dropping the partial last batch keeps shapes static for cuDNN autotuning and torch.compile.
+    # Under torchrun each process reads a disjoint shard of the subset.
+    num_workers = config.get("num_workers", min(8, os.cpu_count() or 1))
+    _check_num_samples(len(subset), config)
+    sampler = DistributedSampler(subset, shuffle=True, drop_last=True) if dist.is_initialized() else None
+    return DataLoader(subset, batch_size=config["batch_size"], shuffle=sampler is None, sampler=sampler, drop_last=True, num_workers=num_workers,
+                      pin_memory=config["use_cuda"], persistent_workers=num_workers > 0,
+                      prefetch_factor=config.get("prefetch_factor", 2) if num_workers > 0 else None)
+
+
+# ------------------------------
+# DALI DataLoader: JPEG decode and preprocessing on the GPU
+# ------------------------------
+class DALIDataLoader:
+    """Adapts a DALIGenericIterator to the (imgs, labels) batches expected by train_epoch."""
+
+    def __init__(self, iterator):
+        self.iterator = iterator
+
+    def __len__(self):
+        return len(self.iterator)
+
+    def __iter__(self):
+        for batch in self.iterator:
+            yield batch[0]["images"], batch[0]["labels"]
+
+
+def get_dali_dataloader(config):
+    if pipeline_def is None:
+        raise ImportError("'use_dali' is set but NVIDIA DALI is not installed (pip install nvidia-dali-cuda120).")
+
+    # Reuse torchvision's CelebA for download/integrity checks and the train split file list
+    dataset = datasets.CelebA(root=config["data_root"], split="train", download=True)
+    image_dir = os.path.join(dataset.root, dataset.base_folder, "img_align_celeba")
+    subset_size = config.get("subset_size", len(dataset))
+    indices = torch.randperm(len(dataset), generator=_subset_rng(config))[:subset_size]
+    files = [os.path.join(image_dir, dataset.filename[i]) for i in indices]
+    _check_num_samples(len(files), config)
+
+    @pipeline_def
+    def celeba_pipeline():
+        shard_id, num_shards = (dist.get_rank(), dist.get_world_size()) if dist.is_initialized() else (0, 1)
+        jpegs, labels = fn.readers.file(files=files, random_shuffle=True, shard_id=shard_id, num_shards=num_shards, name="Reader")
+        # nvJPEG decode on the GPU, then the same CenterCrop(178) -> Resize -> Normalize as get_dataloader
+        images = fn.decoders.image(jpegs, device="mixed", output_type=types.RGB)
+        images = fn.crop(images, crop=(178, 178))
+        images = fn.resize(images, resize_x=config["image_size"], resize_y=config["image_size"])
+        images = fn.crop_mirror_normalize(images, dtype=types.FLOAT, output_layout="CHW",
+                                          mean=[127.5] * 3, std=[127.5] * 3)
+        return images, labels
+
+    # A deeper prefetch queue only holds more decoded batches in GPU memory
+    pipe = celeba_pipeline(batch_size=config["batch_size"], num_threads=config.get("num_workers", 4),
+                           device_id=torch.cuda.current_device(), prefetch_queue_depth=2)
+    pipe.build()
+    iterator = DALIGenericIterator(pipe, ["images", "labels"], reader_name="Reader",
+                                   last_batch_policy=LastBatchPolicy.DROP, auto_reset=True)
+    return DALIDataLoader(iterator)
 
 
 def generate_run_name(config):
@@ -302,16 +517,57 @@ def generate_run_name(config):
 def main(config):
     if config["use_cuda"] and not torch.cuda.is_available():
         raise RuntimeError("CUDA is not available, but 'use_cuda' is set to True.")
-    
-    device = torch.device("cuda" if config["use_cuda"] and torch.cuda.is_available() else "cpu")
+
+    # Launched with torchrun: one process per GPU, gradients all-reduced by DDP
+    distributed = "LOCAL_RANK" in os.environ
+    if distributed:
+        if not config["use_cuda"]:
+            raise RuntimeError("Distributed training requires 'use_cuda' to be set to True.")
+        dist.init_process_group("nccl")
+        local_rank = int(os.environ["LOCAL_RANK"])
+        torch.cuda.set_device(local_rank)
+        device = torch.device(f"cuda:{local_rank}")
+    else:
+        device = torch.device("cuda" if config["use_cuda"] and torch.cuda.is_available() else "cpu")
+    is_main_process = not distributed or dist.get_rank() == 0
+    if not is_main_process:
+        # Keep the console readable: other ranks only report warnings and errors
+        logger.setLevel(logging.WARNING)
+
+    # Conv shapes are fixed for the whole run, so let cuDNN autotune its algorithms once,
+    # and allow TF32 for any float32 matmuls/convolutions on Ampere+ GPUs
+    torch.backends.cudnn.benchmark = True
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
     
     # Initialize models and optimizers
     generator = Generator(config).to(device)
     discriminator = Discriminator(config).to(device)
-    optimizer_g = torch.optim.Adam(generator.parameters(), lr=config["lr"], betas=(config["beta1"], 0.999), weight_decay=config["weight_decay"])
-    optimizer_d = torch.optim.Adam(discriminator.parameters(), lr=config["lr"], betas=(config["beta1"], 0.999), weight_decay=config["weight_decay"])
+    # NHWC layout lets cuDNN pick Tensor Core friendly conv kernels
+    generator = generator.to(memory_format=torch.channels_last)
+    discriminator = discriminator.to(memory_format=torch.channels_last)
+    if config.get("compile", False):
+        # Compile in place so state_dict keys (and therefore checkpoints) are unchanged.
+        # Shapes are fixed by the config, so specialize on them instead of tracing dynamic shapes.
+        generator.compile(mode=config.get("compile_mode", "default"), dynamic=False)
+        discriminator.compile(mode=config.get("compile_mode", "default"), dynamic=False)
+    # Single-kernel fused Adam on CUDA; multi-tensor (foreach) implementation elsewhere
+    adam_impl = {"fused": True} if device.type == "cuda" else {"foreach": True}
+    optimizer_g = torch.optim.Adam(generator.parameters(), lr=config["lr"], betas=(config["beta1"], 0.999), weight_decay=config["weight_decay"], **adam_impl)
+    optimizer_d = torch.optim.Adam(discriminator.parameters(), lr=config["lr"], betas=(config["beta1"], 0.999), weight_decay=config["weight_decay"], **adam_impl)
     
-    dataloader = get_dataloader(config)
+    # Loss scaling is only needed for fp16; with bf16/fp32 the scaler is a no-op
+    scaler = torch.amp.GradScaler("cuda", enabled=device.type == "cuda" and config.get("amp_dtype", "bfloat16") == "float16")
+
+    # Rank 0 downloads/caches the dataset first; the other ranks then reuse it
+    # (rank 0 always reaches its barrier, even when building the dataset fails).
+    if distributed and not is_main_process:
+        dist.barrier()
+    try:
+        dataloader = get_dali_dataloader(config) if config.get("use_dali", False) else get_dataloader(config)
+    finally:
+        if distributed and is_main_process:
+            dist.barrier()
     
     # Create a unique checkpoint folder based on hyperparameters
     checkpoint_folder = generate_checkpoint_folder(config)
@@ -320,26 +576,45 @@ def main(config):
     run_id = None
     global_step = 0
     if os.path.exists(checkpoint_folder) and config.get("resume_training", True):
-        start_epoch, global_step, run_id = load_checkpoint(checkpoint_folder, generator, discriminator, optimizer_g, optimizer_d, device, config)
+        start_epoch, global_step, run_id = load_checkpoint(checkpoint_folder, generator, discriminator, optimizer_g, optimizer_d, scaler, device, config)
+
+    # The wrapped models are only used for training; checkpoints and evaluation use the plain
+    # modules so state_dict keys carry no "module." prefix.
+    train_generator, train_discriminator = generator, discriminator
+    if distributed:
+        train_generator = DDP(generator, device_ids=[local_rank], broadcast_buffers=False)
+        train_discriminator = DDP(discriminator, device_ids=[local_rank], broadcast_buffers=False)
 
     # Generate a meaningful run name if not provided in config
     run_name = generate_run_name(config)
     tags = config.get("tags", [])
 
-    wandb.init(project=config["wandb_project"], config=config, resume="allow", id=run_id, name=run_name, tags=tags)
+    # Only rank 0 reports to WandB; a disabled run turns logging calls on other ranks into no-ops
+    if is_main_process:
+        wandb.init(project=config["wandb_project"], config=config, resume="allow", id=run_id, name=run_name, tags=tags)
+    else:
+        wandb.init(mode="disabled")
     wandb.watch(generator, log="all")
     wandb.watch(discriminator, log="all")
 
     try:
         for epoch in range(start_epoch, config["epochs"]):
-            global_step = train_epoch(generator, discriminator, optimizer_g, optimizer_d, dataloader, device, config, epoch, global_step)
+            if isinstance(getattr(dataloader, "sampler", None), DistributedSampler):
+                dataloader.sampler.set_epoch(epoch)
+            global_step = train_epoch(train_generator, train_discriminator, optimizer_g, optimizer_d, scaler, dataloader, device, config, epoch, global_step)
             
-            if epoch % config["checkpoint_interval"] == 0 or epoch == config["epochs"] - 1:
+            if is_main_process and (epoch % config["checkpoint_interval"] == 0 or epoch == config["epochs"] - 1):
                 evaluate(generator, device, config, step=global_step)
-                save_checkpoint(checkpoint_folder, generator, discriminator, optimizer_g, optimizer_d, epoch, global_step, config)
+                save_checkpoint(checkpoint_folder, generator, discriminator, optimizer_g, optimizer_d, scaler, epoch, global_step, config)
     finally:
-        wandb.finish()
-        logger.info("WandB run finished.")
+        # A failed background write must not skip the cleanup below
+        try:
+            wait_for_checkpoint()
+        finally:
+            wandb.finish()
+            logger.info("WandB run finished.")
+            if distributed:
+                dist.destroy_process_group()
 
 
 # ------------------------------
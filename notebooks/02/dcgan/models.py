@@ -70,8 +70,8 @@ class Discriminator(nn.Module):
             nn.LeakyReLU(0.2, inplace=True),
             
             # State: (ndf*8) x 4 x 4
-            nn.Conv2d(self.ndf * 8, 1, 4, 1, 0, bias=False),
-            nn.Sigmoid()
+            nn.Conv2d(self.ndf * 8, 1, 4, 1, 0, bias=False)
+            # Output: raw logits, paired with binary_cross_entropy_with_logits
         )
     
     def forward(self, input):
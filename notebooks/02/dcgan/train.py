@@ -37,20 +37,20 @@ def train_epoch(generator, discriminator, optimizer_g, optimizer_d, dataloader,
         # -----------------
         #  Train Generator
         # -----------------
-        optimizer_g.zero_grad()
+        optimizer_g.zero_grad(set_to_none=True)
         noise = torch.randn(
             batch_size, config["latent_dim"], 1, 1, device=device)
         gen_imgs = generator(noise)
-        g_loss = F.binary_cross_entropy(discriminator(gen_imgs), valid)
+        g_loss = F.binary_cross_entropy_with_logits(discriminator(gen_imgs), valid)
         g_loss.backward()
         optimizer_g.step()
 
         # ---------------------
         #  Train Discriminator
         # ---------------------
-        optimizer_d.zero_grad()
-        real_loss = F.binary_cross_entropy(discriminator(imgs), valid)
-        fake_loss = F.binary_cross_entropy(
+        optimizer_d.zero_grad(set_to_none=True)
+        real_loss = F.binary_cross_entropy_with_logits(discriminator(imgs), valid)
+        fake_loss = F.binary_cross_entropy_with_logits(
             discriminator(gen_imgs.detach()), fake)
         d_loss = (real_loss + fake_loss) / 2
         d_loss.backward()